@@ -58,6 +58,15 @@ class VQEUVCCFactory(MinimumEigensolverFactory):
         vqe3 = factory.get_solver(problem, qubit_converter)
         print(type(vqe3.ansatz))  # UVCC
 
+    .. note::
+
+       The ansatz which has been set up by :meth:`get_solver` is reused by subsequent calls, as
+       long as neither the problem's number of modals, nor the ``qubit_converter`` and its
+       conversion state (as updated by :meth:`~.QubitConverter.convert` or
+       :meth:`~.QubitConverter.force_match`), nor the :attr:`ansatz` and :attr:`initial_state`
+       of the factory have been changed. This also applies to the default :class:`~.UVCCSD`
+       ansatz, which is thus shared among the returned solvers.
+
     """
 
     def __init__(
@@ -84,14 +93,24 @@ class VQEUVCCFactory(MinimumEigensolverFactory):
                 default to the :class:`~.VSCF` state.
             ansatz: Allows specification of a custom :class:`~.UCC` instance. This defaults to None
                 where the factory will internally create and use a :class:`~.UVCCSD` ansatz.
-            kwargs: Remaining keyword arguments are passed to the :class:`VQE`.
+            kwargs: Remaining keyword arguments are passed to the :class:`VQE`. The VQE is only
+                constructed upon first access of :attr:`minimum_eigensolver` (which includes calls
+                to :meth:`get_solver`), so invalid arguments raise at that point rather than here.
         """
 
         self._initial_state = initial_state
         self._initial_point = initial_point if initial_point is not None else VSCFInitialPoint()
         self._ansatz = ansatz
 
-        self._vqe = VQE(**kwargs)
+        self._cache_key: Optional[tuple] = None
+        self._cached_ansatz: Optional[UVCC] = None
+        self._cached_initial_state: Optional[QuantumCircuit] = None
+        self._cached_converter_state: Optional[tuple] = None
+        self._initial_point_key: Optional[tuple] = None
+
+        # the VQE is only constructed upon first access of the minimum_eigensolver
+        self._vqe_kwargs = kwargs
+        self._vqe: Optional[VQE] = None
 
     @property
     def ansatz(self) -> Optional[UVCC]:
@@ -108,6 +127,7 @@ class VQEUVCCFactory(MinimumEigensolverFactory):
         If set to ``None`` it defaults to :class:`~.UVCCSD`.
         """
         self._ansatz = ansatz
+        self._cache_key = None
 
     @property
     def initial_state(self) -> Optional[QuantumCircuit]:
@@ -121,6 +141,7 @@ class VQEUVCCFactory(MinimumEigensolverFactory):
         If ``None`` is passed, this factory will default to using the :class:`~.VSCF`.
         """
         self._initial_state = initial_state
+        self._cache_key = None
 
     @property
     def initial_point(self) -> Optional[Union[np.ndarray, InitialPoint]]:
@@ -152,24 +173,66 @@ class VQEUVCCFactory(MinimumEigensolverFactory):
 
         basis = problem.basis
         num_modals = basis.num_modals_per_mode
-        num_modes = len(num_modals)
-
-        if isinstance(num_modals, int):
-            num_modals = [num_modals] * num_modes
 
-        initial_state = self.initial_state
-        if initial_state is None:
-            initial_state = VSCF(num_modals)
-
-        ansatz = self._ansatz
-        if ansatz is None:
-            ansatz = UVCCSD()
-        ansatz.qubit_converter = qubit_converter
-        ansatz.num_modals = num_modals
-        ansatz.initial_state = initial_state
+        # the immutable form doubles as part of the cache key, so the list for the circuits below
+        # only gets materialized when the ansatz actually needs to be rebuilt. The basis stores
+        # either a plain int or a list, so the exact type check is sufficient here.
+        if type(num_modals) is int:  # pylint: disable=unidiomatic-typecheck
+            num_modals_key = (num_modals,) * problem.num_modes
+        else:
+            num_modals_key = tuple(num_modals)
+
+        # the ansatz only needs to be rebuilt when one of its inputs has changed since the last call
+        key = (id(qubit_converter), num_modals_key, id(self._initial_state), id(self._ansatz))
+        ansatz = None
+        if key == self._cache_key:
+            cached = self._cached_ansatz
+            # the key only tracks object identities, so guard against in-place modifications
+            if (
+                cached.qubit_converter is qubit_converter
+                and cached.num_modals is not None
+                and tuple(cached.num_modals) == num_modals_key
+                and cached.initial_state is self._cached_initial_state
+                and all(
+                    current is previous
+                    for current, previous in zip(
+                        self._converter_state(qubit_converter), self._cached_converter_state
+                    )
+                )
+            ):
+                ansatz = cached
+
+        ansatz_rebuilt = ansatz is None
+        if ansatz_rebuilt:
+            num_modals = list(num_modals_key)
+
+            initial_state = self.initial_state
+            if initial_state is None:
+                initial_state = VSCF(num_modals)
+
+            ansatz = self._ansatz
+            if ansatz is None:
+                ansatz = UVCCSD()
+            ansatz.qubit_converter = qubit_converter
+            ansatz.num_modals = num_modals
+            ansatz.initial_state = initial_state
+
+            self._cache_key = key
+            self._cached_ansatz = ansatz
+            self._cached_initial_state = initial_state
+            self._cached_converter_state = self._converter_state(qubit_converter)
 
         if isinstance(self.initial_point, InitialPoint):
-            self.initial_point.ansatz = ansatz
+            # assigning the ansatz discards the initial point which has been computed for it, so this
+            # is only done when the ansatz may have changed since that computation
+            initial_point_key = (ansatz.reps, len(ansatz.excitation_list))
+            if (
+                ansatz_rebuilt
+                or self.initial_point.ansatz is not ansatz
+                or initial_point_key != self._initial_point_key
+            ):
+                self.initial_point.ansatz = ansatz
+                self._initial_point_key = initial_point_key
             initial_point = self.initial_point.to_numpy_array()
         else:
             initial_point = self.initial_point
@@ -178,10 +241,27 @@ class VQEUVCCFactory(MinimumEigensolverFactory):
         self.minimum_eigensolver.ansatz = ansatz
         return self.minimum_eigensolver
 
+    @staticmethod
+    def _converter_state(qubit_converter: QubitConverter) -> tuple:
+        """Returns the parts of the converter which the ansatz operators are built from.
+
+        The converter stores the state of its last conversion in place, so these are compared by
+        identity in order to detect that the ansatz needs to be rebuilt for the same converter.
+        """
+        # pylint: disable=protected-access
+        return (
+            qubit_converter.mapper,
+            qubit_converter.two_qubit_reduction,
+            qubit_converter._z2symmetries,
+            qubit_converter._num_particles,
+        )
+
     def supports_aux_operators(self):
         return VQE.supports_aux_operators()
 
     @property
     def minimum_eigensolver(self) -> VQE:
         """Returns the solver instance."""
+        if self._vqe is None:
+            self._vqe = VQE(**self._vqe_kwargs)
         return self._vqe
@@ -14,11 +14,19 @@
 import unittest
 
 from test import QiskitNatureTestCase
+
+import numpy as np
+
 from qiskit import BasicAer
+from qiskit.opflow import Z2Symmetries
+from qiskit.quantum_info import Pauli
 from qiskit.utils import QuantumInstance
-from qiskit_nature.second_q.circuit.library import HartreeFock, UVCCSD
+from qiskit_nature.second_q.circuit.library import HartreeFock, UVCCSD, VSCF
+from qiskit_nature.second_q.hamiltonians import VibrationalEnergy
 from qiskit_nature.second_q.mappers import QubitConverter
-from qiskit_nature.second_q.mappers import JordanWignerMapper
+from qiskit_nature.second_q.mappers import DirectMapper, JordanWignerMapper
+from qiskit_nature.second_q.problems import VibrationalStructureProblem
+from qiskit_nature.second_q.properties.bases import HarmonicBasis
 from qiskit_nature.second_q.algorithms import VQEUVCCFactory
 from qiskit_nature.second_q.algorithms.initial_points import VSCFInitialPoint
 
@@ -126,6 +134,98 @@ class TestVQEUVCCFactory(QiskitNatureTestCase):
             self._vqe_uvcc_factory.initial_state = initial_state
             self.assertEqual(self._vqe_uvcc_factory.initial_state, initial_state)
 
+    def test_minimum_eigensolver(self):
+        """Test that the VQE gets constructed lazily from the remaining keyword arguments"""
+        with self.subTest("Keyword arguments are forwarded"):
+            factory = VQEUVCCFactory(quantum_instance=self.quantum_instance)
+            vqe = factory.minimum_eigensolver
+            self.assertIs(vqe.quantum_instance, self.quantum_instance)
+            self.assertIs(factory.minimum_eigensolver, vqe)
+
+        with self.subTest("Invalid keyword arguments raise upon first access"):
+            factory = VQEUVCCFactory(bogus=1)
+            with self.assertRaises(TypeError):
+                _ = factory.minimum_eigensolver
+
+    def test_get_solver_reuses_ansatz(self):
+        """Test that repeated get_solver calls with unchanged inputs reuse the ansatz"""
+        problem = VibrationalStructureProblem(VibrationalEnergy([]), num_modes=2, num_modals=2)
+        problem.basis = HarmonicBasis([2, 2])
+        converter = QubitConverter(DirectMapper())
+
+        solver = self._vqe_uvcc_factory.get_solver(problem, converter)
+        ansatz = solver.ansatz
+        initial_point = solver.initial_point
+
+        with self.subTest("Unchanged inputs"):
+            solver = self._vqe_uvcc_factory.get_solver(problem, converter)
+            self.assertIs(solver.ansatz, ansatz)
+            self.assertIs(solver.initial_point, initial_point)
+
+        with self.subTest("Different qubit converter"):
+            solver = self._vqe_uvcc_factory.get_solver(problem, QubitConverter(DirectMapper()))
+            self.assertIsNot(solver.ansatz, ansatz)
+            np.testing.assert_array_equal(solver.initial_point, initial_point)
+
+        with self.subTest("Ansatz setter"):
+            new_ansatz = UVCCSD()
+            self._vqe_uvcc_factory.ansatz = new_ansatz
+            solver = self._vqe_uvcc_factory.get_solver(problem, converter)
+            self.assertIs(solver.ansatz, new_ansatz)
+            self.assertEqual(solver.ansatz.num_modals, [2, 2])
+
+        with self.subTest("Initial state setter"):
+            initial_state = VSCF([2, 2])
+            self._vqe_uvcc_factory.initial_state = initial_state
+            solver = self._vqe_uvcc_factory.get_solver(problem, converter)
+            self.assertIs(solver.ansatz.initial_state, initial_state)
+
+    def test_get_solver_ansatz_modified_in_place(self):
+        """Test that an ansatz modified in place in between get_solver calls gets set up again"""
+        problem = VibrationalStructureProblem(VibrationalEnergy([]), num_modes=2, num_modals=2)
+        problem.basis = HarmonicBasis([2, 2])
+        converter = QubitConverter(DirectMapper())
+        ansatz = UVCCSD()
+        factory = VQEUVCCFactory(ansatz=ansatz)
+
+        factory.get_solver(problem, converter)
+        ansatz.num_modals = [3, 3]
+        solver = factory.get_solver(problem, converter)
+
+        self.assertIs(solver.ansatz, ansatz)
+        self.assertEqual(solver.ansatz.num_modals, [2, 2])
+        self.assertEqual(solver.ansatz.num_qubits, 4)
+        self.assertEqual(solver.ansatz.initial_state.num_qubits, 4)
+        self.assertEqual(len(solver.initial_point), solver.ansatz.num_parameters)
+
+        ansatz.reps = 2
+        solver = factory.get_solver(problem, converter)
+        self.assertEqual(len(solver.initial_point), solver.ansatz.num_parameters)
+
+    def test_get_solver_scalar_num_modals(self):
+        """Test that a scalar number of modals gets broadcast to all modes"""
+        problem = VibrationalStructureProblem(VibrationalEnergy([]), num_modes=3, num_modals=2)
+        problem.basis = HarmonicBasis(2)
+        solver = self._vqe_uvcc_factory.get_solver(problem, QubitConverter(DirectMapper()))
+        self.assertEqual(solver.ansatz.num_modals, [2, 2, 2])
+
+    def test_get_solver_converter_modified_in_place(self):
+        """Test that the ansatz gets rebuilt when the conversion state of the converter changes"""
+        problem = VibrationalStructureProblem(VibrationalEnergy([]), num_modes=2, num_modals=2)
+        problem.basis = HarmonicBasis([2, 2])
+        converter = QubitConverter(DirectMapper())
+
+        solver = self._vqe_uvcc_factory.get_solver(problem, converter)
+        self.assertEqual(solver.ansatz.num_qubits, 4)
+
+        z2symmetries = Z2Symmetries(
+            [Pauli("IIZZ"), Pauli("ZZII")], [Pauli("IIIX"), Pauli("IXII")], [0, 2], [1, 1]
+        )
+        converter.force_match(z2symmetries=z2symmetries)
+        solver = self._vqe_uvcc_factory.get_solver(problem, converter)
+        self.assertEqual(solver.ansatz.num_qubits, 2)
+        self.assertEqual(len(solver.initial_point), len(solver.ansatz.excitation_list))
+
 
 if __name__ == "__main__":
     unittest.main()
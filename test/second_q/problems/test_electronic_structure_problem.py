@@ -43,17 +43,20 @@ class TestElectronicStructureProblem(QiskitNatureTestCase):
         electronic_structure_problem = driver.run()
 
         electr_sec_quant_op, second_quantized_ops = electronic_structure_problem.second_q_ops()
+        actual_list = electr_sec_quant_op.to_list()
 
         with self.subTest("Check expected length of the list of second quantized operators."):
             assert len(second_quantized_ops) == expected_num_of_sec_quant_ops
         with self.subTest("Check types in the list of second quantized operators."):
             for second_quantized_op in second_quantized_ops.values():
                 assert isinstance(second_quantized_op, SecondQuantizedOp)
+        with self.subTest("Check length of electronic second quantized operator."):
+            assert len(actual_list) == len(expected_fermionic_op)
         with self.subTest("Check components of electronic second quantized operator."):
-            assert all(
-                s[0] == t[0] and np.isclose(np.abs(s[1]), np.abs(t[1]))
-                for s, t in zip(expected_fermionic_op, electr_sec_quant_op.to_list())
-            )
+            exp_labels, exp_coeffs = zip(*expected_fermionic_op)
+            got_labels, got_coeffs = zip(*actual_list)
+            assert exp_labels == got_labels
+            assert np.allclose(np.abs(np.asarray(exp_coeffs)), np.abs(np.asarray(got_coeffs)))
 
     @unittest.skipIf(not _optionals.HAS_PYSCF, "pyscf not available.")
     def test_second_q_ops_with_active_space(self):
@@ -70,17 +73,20 @@ class TestElectronicStructureProblem(QiskitNatureTestCase):
 
         electronic_structure_problem = trafo.transform(driver.run())
         electr_sec_quant_op, second_quantized_ops = electronic_structure_problem.second_q_ops()
+        actual_list = electr_sec_quant_op.to_list()
 
         with self.subTest("Check expected length of the list of second quantized operators."):
             assert len(second_quantized_ops) == expected_num_of_sec_quant_ops
         with self.subTest("Check types in the list of second quantized operators."):
             for second_quantized_op in second_quantized_ops.values():
                 assert isinstance(second_quantized_op, SecondQuantizedOp)
+        with self.subTest("Check length of electronic second quantized operator."):
+            assert len(actual_list) == len(expected_fermionic_op)
         with self.subTest("Check components of electronic second quantized operator."):
-            assert all(
-                s[0] == t[0] and np.isclose(np.abs(s[1]), np.abs(t[1]))
-                for s, t in zip(expected_fermionic_op, electr_sec_quant_op.to_list())
-            )
+            exp_labels, exp_coeffs = zip(*expected_fermionic_op)
+            got_labels, got_coeffs = zip(*actual_list)
+            assert exp_labels == got_labels
+            assert np.allclose(np.abs(np.asarray(exp_coeffs)), np.abs(np.asarray(got_coeffs)))
 
 
 if __name__ == "__main__":